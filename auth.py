@@ -2,6 +2,16 @@
 
 import github3
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Retry requests that GitHub rejected because of its secondary rate limits
+# (429, honouring the Retry-After header) or because it was briefly unavailable
+RETRY_STRATEGY = Retry(
+    total=3,
+    backoff_factor=2,
+    status_forcelist=(429, 502, 503),
+    raise_on_status=False,
+)
 
 
 def auth_to_github(
@@ -48,6 +58,8 @@ def auth_to_github(
 
     if not github_connection:
         raise ValueError("Unable to authenticate to GitHub")
+
+    github_connection.session.mount("https://", HTTPAdapter(max_retries=RETRY_STRATEGY))
     return github_connection  # type: ignore
 
 
@@ -28,6 +28,22 @@ class IssueWithMetrics:
 
     # pylint: disable=too-many-instance-attributes
 
+    # A report can hold tens of thousands of these, so don't give each one a __dict__
+    __slots__ = (
+        "title",
+        "html_url",
+        "author",
+        "assignee",
+        "assignees",
+        "time_to_first_response",
+        "time_to_close",
+        "time_to_answer",
+        "time_in_draft",
+        "label_metrics",
+        "mentor_activity",
+        "created_at",
+    )
+
     def __init__(
         self,
         title,
@@ -55,6 +55,8 @@ class EnvVars:
         rate_limit_bypass (bool): If set to TRUE, bypass the rate limit for the GitHub API
         draft_pr_tracking (bool): If set to TRUE, track PR time in draft state
             in addition to other metrics
+        response_cache_file (str): If set, the file GitHub API responses are cached
+            in between runs
     """
 
     def __init__(
@@ -85,6 +87,7 @@ class EnvVars:
         output_file: str,
         rate_limit_bypass: bool = False,
         draft_pr_tracking: bool = False,
+        response_cache_file: str = "",
     ):
         self.gh_app_id = gh_app_id
         self.gh_app_installation_id = gh_app_installation_id
@@ -112,6 +115,7 @@ class EnvVars:
         self.output_file = output_file
         self.rate_limit_bypass = rate_limit_bypass
         self.draft_pr_tracking = draft_pr_tracking
+        self.response_cache_file = response_cache_file
 
     def __repr__(self):
         return (
@@ -142,6 +146,7 @@ class EnvVars:
             f"{self.output_file}"
             f"{self.rate_limit_bypass}"
             f"{self.draft_pr_tracking}"
+            f"{self.response_cache_file}"
         )
 
 
@@ -228,6 +233,7 @@ def get_env_vars(test: bool = False) -> EnvVars:
     output_file = os.getenv("OUTPUT_FILE", "")
     rate_limit_bypass = get_bool_env_var("RATE_LIMIT_BYPASS", False)
     draft_pr_tracking = get_bool_env_var("DRAFT_PR_TRACKING", False)
+    response_cache_file = os.getenv("RESPONSE_CACHE_FILE", "").strip()
 
     # Hidden columns
     hide_assignee = get_bool_env_var("HIDE_ASSIGNEE", False)
@@ -271,4 +277,5 @@ def get_env_vars(test: bool = False) -> EnvVars:
         output_file,
         rate_limit_bypass,
         draft_pr_tracking,
+        response_cache_file,
     )
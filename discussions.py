@@ -25,20 +25,18 @@ def get_discussions(token: str, search_query: str, ghe: str):
     query = """
     query($query: String!, $cursor: String) {
         search(query: $query, type: DISCUSSION, first: 100, after: $cursor) {
-            edges {
-                node {
-                    ... on Discussion {
-                        title
-                        url
-                        createdAt
-                        comments(first: 1) {
-                            nodes {
-                                createdAt
-                            }
+            nodes {
+                ... on Discussion {
+                    title
+                    url
+                    createdAt
+                    comments(first: 1) {
+                        nodes {
+                            createdAt
                         }
-                        answerChosenAt
-                        closedAt
                     }
+                    answerChosenAt
+                    closedAt
                 }
             }
             pageInfo {
@@ -59,39 +57,41 @@ def get_discussions(token: str, search_query: str, ghe: str):
     discussions = []
     cursor = None
 
-    while True:
-        # Set the variables for the GraphQL query
-        variables = {"query": search_query, "cursor": cursor}
-
-        # Send the GraphQL request
-        response = requests.post(
-            f"{api_endpoint}/graphql",
-            json={"query": query, "variables": variables},
-            headers=headers,
-            timeout=60,
-        )
-
-        # Check for errors in the GraphQL response
-        if response.status_code != 200:
-            raise ValueError(
-                f"GraphQL query failed with status code {response.status_code}"
+    # Reuse one connection for all the pages instead of reconnecting for each
+    with requests.Session() as session:
+        session.headers.update(headers)
+
+        while True:
+            # Set the variables for the GraphQL query
+            variables = {"query": search_query, "cursor": cursor}
+
+            # Send the GraphQL request
+            response = session.post(
+                f"{api_endpoint}/graphql",
+                json={"query": query, "variables": variables},
+                timeout=60,
             )
 
-        response_json = response.json()
-        if "errors" in response_json:
-            raise ValueError(f"GraphQL query failed: {response_json['errors']}")
+            # Check for errors in the GraphQL response
+            if response.status_code != 200:
+                raise ValueError(
+                    f"GraphQL query failed with status code {response.status_code}"
+                )
+
+            response_json = response.json()
+            if "errors" in response_json:
+                raise ValueError(f"GraphQL query failed: {response_json['errors']}")
 
-        data = response_json["data"]
+            data = response_json["data"]
 
-        # Extract the discussions from the current page
-        for edge in data["search"]["edges"]:
-            discussions.append(edge["node"])
+            # Extract the discussions from the current page
+            discussions.extend(data["search"]["nodes"])
 
-        # Check if there are more pages
-        page_info = data["search"]["pageInfo"]
-        if not page_info["hasNextPage"]:
-            break
+            # Check if there are more pages
+            page_info = data["search"]["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
 
-        cursor = page_info["endCursor"]
+            cursor = page_info["endCursor"]
 
     return discussions
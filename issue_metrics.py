@@ -6,6 +6,9 @@ the average time to first response and time to close and writes the issues with
 their metrics to a markdown file.
 
 Functions:
+    get_issue_metrics(issue: Union[dict, github3.search.IssueSearchResult],
+        env_vars: EnvVars, ...) -> tuple[Union[IssueWithMetrics, None], Union[str, None]]:
+        Calculate the metrics for a single issue/pr/discussion.
     get_per_issue_metrics(issues: Union[List[dict], List[github3.issues.Issue]],
         discussions: bool = False), labels: Union[List[str], None] = None,
         ignore_users: List[str] = [] -> tuple[List, int, int]:
@@ -16,6 +19,8 @@ Functions:
 """
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List, Union
 
@@ -30,6 +35,7 @@ from labels import get_label_metrics, get_stats_time_in_labels
 from markdown_helpers import markdown_too_large_for_issue_body, split_markdown_file
 from markdown_writer import write_to_markdown
 from most_active_mentors import count_comments_per_user, get_mentor_count
+from response_cache import enable_response_cache
 from search import get_owners_and_repositories, search_issues
 from time_in_draft import get_stats_time_in_draft, measure_time_in_draft
 from time_to_answer import get_stats_time_to_answer, measure_time_to_answer
@@ -42,6 +48,149 @@ from time_to_merge import measure_time_to_merge
 from time_to_ready_for_review import get_time_to_ready_for_review
 
 
+def get_issue_metrics(
+    issue: Union[dict, github3.search.IssueSearchResult],  # type: ignore
+    env_vars: EnvVars,
+    discussions: bool = False,
+    labels: Union[List[str], None] = None,
+    ignore_users: Union[List[str], None] = None,
+    max_comments_to_eval: int = 20,
+    heavily_involved: int = 3,
+) -> tuple[Union[IssueWithMetrics, None], Union[str, None]]:
+    """
+    Calculate the metrics for a single issue/pr/discussion.
+
+    Args:
+        issue (Union[dict, github3.search.IssueSearchResult]): A GitHub issue
+            or discussion.
+        env_vars (EnvVars): The environment variables for the script.
+        discussions (bool, optional): Whether the issue is a discussion or not.
+            Defaults to False.
+        labels (List[str]): A list of labels to measure time spent in. Defaults to empty list.
+        ignore_users (List[str]): A list of users to ignore when calculating metrics.
+
+    Returns:
+        tuple[Union[IssueWithMetrics, None], Union[str, None]]: The issue with
+            its metrics, or None if the author is ignored, and the state of the
+            issue ("open" or "closed") if it is known.
+
+    """
+    state = None
+    if discussions:
+        issue_with_metrics = IssueWithMetrics(
+            issue["title"],
+            issue["url"],
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+        # Discussions typically don't have assignees in the same way as issues/PRs
+        issue_with_metrics.assignee = None
+        issue_with_metrics.assignees = []
+        if env_vars.hide_time_to_first_response is False:
+            issue_with_metrics.time_to_first_response = measure_time_to_first_response(
+                None, issue, ignore_users
+            )
+        if env_vars.enable_mentor_count:
+            issue_with_metrics.mentor_activity = count_comments_per_user(
+                None,
+                issue,
+                None,
+                None,
+                ignore_users,
+                max_comments_to_eval,
+                heavily_involved,
+            )
+        if env_vars.hide_time_to_answer is False:
+            issue_with_metrics.time_to_answer = measure_time_to_answer(issue)
+        if issue["closedAt"]:
+            state = "closed"
+            if not env_vars.hide_time_to_close:
+                issue_with_metrics.time_to_close = measure_time_to_close(None, issue)
+        else:
+            state = "open"
+    else:
+        if ignore_users and issue.user["login"] in ignore_users:  # type: ignore
+            return None, None
+
+        issue_with_metrics = IssueWithMetrics(
+            title=issue.title,  # type: ignore
+            html_url=issue.html_url,  # type: ignore
+            author=issue.user["login"],  # type: ignore
+        )
+
+        # Extract assignee information from the issue
+        issue_dict = issue.issue.as_dict()  # type: ignore
+        assignee = None
+        assignees = []
+
+        if issue_dict.get("assignee"):
+            assignee = issue_dict["assignee"]["login"]
+
+        if issue_dict.get("assignees"):
+            assignees = [a["login"] for a in issue_dict["assignees"]]
+
+        issue_with_metrics.assignee = assignee
+        issue_with_metrics.assignees = assignees
+
+        # Check if issue is actually a pull request
+        pull_request, ready_for_review_at = None, None
+        if issue.issue.pull_request_urls:  # type: ignore
+            # Only fetch the pull request and its events when a metric needs them
+            if (
+                env_vars.hide_time_to_first_response is False
+                or env_vars.enable_mentor_count
+                or (
+                    issue.state == "closed"  # type: ignore
+                    and not env_vars.hide_time_to_close
+                )
+            ):
+                pull_request = issue.issue.pull_request()  # type: ignore
+                ready_for_review_at = get_time_to_ready_for_review(issue, pull_request)
+            if env_vars.draft_pr_tracking:
+                issue_with_metrics.time_in_draft = measure_time_in_draft(issue=issue)
+
+        if env_vars.hide_time_to_first_response is False:
+            issue_with_metrics.time_to_first_response = measure_time_to_first_response(
+                issue, None, pull_request, ready_for_review_at, ignore_users
+            )
+        if env_vars.enable_mentor_count:
+            issue_with_metrics.mentor_activity = count_comments_per_user(
+                issue,
+                None,
+                pull_request,
+                ready_for_review_at,
+                ignore_users,
+                max_comments_to_eval,
+                heavily_involved,
+            )
+        if labels and env_vars.hide_label_metrics is False:
+            issue_with_metrics.label_metrics = get_label_metrics(issue, labels)
+        if issue.state == "closed":  # type: ignore
+            state = "closed"
+            if not env_vars.hide_time_to_close:
+                if pull_request:
+                    issue_with_metrics.time_to_close = measure_time_to_merge(
+                        pull_request, ready_for_review_at
+                    )
+                else:
+                    issue_with_metrics.time_to_close = measure_time_to_close(
+                        issue, None
+                    )
+        elif issue.state == "open":  # type: ignore
+            state = "open"
+    if not env_vars.hide_created_at:
+        if isinstance(issue, github3.search.IssueSearchResult):  # type: ignore
+            issue_with_metrics.created_at = issue.issue.created_at  # type: ignore
+        elif isinstance(issue, dict):  # type: ignore
+            issue_with_metrics.created_at = issue["createdAt"]  # type: ignore
+
+    return issue_with_metrics, state
+
+
 def get_per_issue_metrics(
     issues: Union[List[dict], List[github3.search.IssueSearchResult]],  # type: ignore
     env_vars: EnvVars,
@@ -50,10 +199,14 @@ def get_per_issue_metrics(
     ignore_users: Union[List[str], None] = None,
     max_comments_to_eval: int = 20,
     heavily_involved: int = 3,
+    max_workers: int = 10,
 ) -> tuple[List, int, int]:
     """
     Calculate the metrics for each issue/pr/discussion in a list provided.
 
+    The metrics for each item are fetched from the GitHub API concurrently,
+    since the time spent is dominated by waiting on the network.
+
     Args:
         issues (Union[List[dict], List[github3.search.IssueSearchResult]]): A list of
             GitHub issues or discussions.
@@ -62,6 +215,8 @@ def get_per_issue_metrics(
         labels (List[str]): A list of labels to measure time spent in. Defaults to empty list.
         ignore_users (List[str]): A list of users to ignore when calculating metrics.
         env_vars (EnvVars): The environment variables for the script.
+        max_workers (int, optional): The maximum number of items to fetch
+            metrics for at the same time. Defaults to 10.
 
     Returns:
         tuple[List[IssueWithMetrics], int, int]: A tuple containing a
@@ -73,116 +228,29 @@ def get_per_issue_metrics(
     num_issues_open = 0
     num_issues_closed = 0
 
-    for issue in issues:
-        if discussions:
-            issue_with_metrics = IssueWithMetrics(
-                issue["title"],
-                issue["url"],
-                None,
-                None,
-                None,
-                None,
-                None,
-                None,
-            )
-            # Discussions typically don't have assignees in the same way as issues/PRs
-            issue_with_metrics.assignee = None
-            issue_with_metrics.assignees = []
-            if env_vars.hide_time_to_first_response is False:
-                issue_with_metrics.time_to_first_response = (
-                    measure_time_to_first_response(None, issue, ignore_users)
-                )
-            if env_vars.enable_mentor_count:
-                issue_with_metrics.mentor_activity = count_comments_per_user(
-                    None,
-                    issue,
-                    None,
-                    None,
-                    ignore_users,
-                    max_comments_to_eval,
-                    heavily_involved,
-                )
-            if env_vars.hide_time_to_answer is False:
-                issue_with_metrics.time_to_answer = measure_time_to_answer(issue)
-            if issue["closedAt"]:
-                num_issues_closed += 1
-                if not env_vars.hide_time_to_close:
-                    issue_with_metrics.time_to_close = measure_time_to_close(
-                        None, issue
-                    )
-            else:
-                num_issues_open += 1
-        else:
-            if ignore_users and issue.user["login"] in ignore_users:  # type: ignore
-                continue
-
-            issue_with_metrics = IssueWithMetrics(
-                title=issue.title,  # type: ignore
-                html_url=issue.html_url,  # type: ignore
-                author=issue.user["login"],  # type: ignore
-            )
-
-            # Extract assignee information from the issue
-            issue_dict = issue.issue.as_dict()  # type: ignore
-            assignee = None
-            assignees = []
-
-            if issue_dict.get("assignee"):
-                assignee = issue_dict["assignee"]["login"]
-
-            if issue_dict.get("assignees"):
-                assignees = [a["login"] for a in issue_dict["assignees"]]
-
-            issue_with_metrics.assignee = assignee
-            issue_with_metrics.assignees = assignees
-
-            # Check if issue is actually a pull request
-            pull_request, ready_for_review_at = None, None
-            if issue.issue.pull_request_urls:  # type: ignore
-                pull_request = issue.issue.pull_request()  # type: ignore
-                ready_for_review_at = get_time_to_ready_for_review(issue, pull_request)
-                if env_vars.draft_pr_tracking:
-                    issue_with_metrics.time_in_draft = measure_time_in_draft(
-                        issue=issue
-                    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # executor.map yields results in the same order as the issues
+        results = executor.map(
+            partial(
+                get_issue_metrics,
+                env_vars=env_vars,
+                discussions=discussions,
+                labels=labels,
+                ignore_users=ignore_users,
+                max_comments_to_eval=max_comments_to_eval,
+                heavily_involved=heavily_involved,
+            ),
+            issues,
+        )
 
-            if env_vars.hide_time_to_first_response is False:
-                issue_with_metrics.time_to_first_response = (
-                    measure_time_to_first_response(
-                        issue, None, pull_request, ready_for_review_at, ignore_users
-                    )
-                )
-            if env_vars.enable_mentor_count:
-                issue_with_metrics.mentor_activity = count_comments_per_user(
-                    issue,
-                    None,
-                    pull_request,
-                    ready_for_review_at,
-                    ignore_users,
-                    max_comments_to_eval,
-                    heavily_involved,
-                )
-            if labels and env_vars.hide_label_metrics is False:
-                issue_with_metrics.label_metrics = get_label_metrics(issue, labels)
-            if issue.state == "closed":  # type: ignore
+        for issue_with_metrics, state in results:
+            if issue_with_metrics is None:
+                continue
+            if state == "closed":
                 num_issues_closed += 1
-                if not env_vars.hide_time_to_close:
-                    if pull_request:
-                        issue_with_metrics.time_to_close = measure_time_to_merge(
-                            pull_request, ready_for_review_at
-                        )
-                    else:
-                        issue_with_metrics.time_to_close = measure_time_to_close(
-                            issue, None
-                        )
-            elif issue.state == "open":  # type: ignore
+            elif state == "open":
                 num_issues_open += 1
-        if not env_vars.hide_created_at:
-            if isinstance(issue, github3.search.IssueSearchResult):  # type: ignore
-                issue_with_metrics.created_at = issue.issue.created_at  # type: ignore
-            elif isinstance(issue, dict):  # type: ignore
-                issue_with_metrics.created_at = issue["createdAt"]  # type: ignore
-        issues_with_metrics.append(issue_with_metrics)
+            issues_with_metrics.append(issue_with_metrics)
 
     return issues_with_metrics, num_issues_open, num_issues_closed
 
@@ -249,6 +317,13 @@ def main():  # pragma: no cover
         gh_app_enterprise_only,
     )
 
+    # Reuse unchanged responses from previous runs, if a cache file is set
+    response_cache = None
+    if env_vars.response_cache_file:
+        response_cache = enable_response_cache(
+            github_connection.session, env_vars.response_cache_file
+        )
+
     if not token and gh_app_id and gh_app_installation_id and gh_app_private_key_bytes:
         token = get_github_app_installation_token(
             ghe, gh_app_id, gh_app_private_key_bytes, gh_app_installation_id
@@ -344,6 +419,10 @@ def main():  # pragma: no cover
         env_vars=env_vars,
     )
 
+    # All API requests are done, so drop the responses this run did not need
+    if response_cache:
+        response_cache.prune()
+
     stats_time_to_first_response = get_stats_time_to_first_response(issues_with_metrics)
     stats_time_to_close = None
     if num_issues_closed > 0:
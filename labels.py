@@ -54,12 +54,16 @@ def get_label_metrics(issue: github3.issues.Issue, labels: List[str]) -> dict:
     if not label_events:
         return label_metrics
 
+    # Parse the issue timestamps once rather than for every label event
+    created_at = datetime.fromisoformat(issue.created_at)
+    closed_at = None
+    if issue.closed_at is not None:
+        closed_at = datetime.fromisoformat(issue.closed_at)
+
     # Calculate the time to add or subtract to the time spent in label based on the label events
     for event in label_events:
         # Skip labeling events that have occurred past issue close time
-        if issue.closed_at is not None and (
-            event.created_at >= datetime.fromisoformat(issue.closed_at)
-        ):
+        if closed_at is not None and event.created_at >= closed_at:
             continue
 
         if event.event == "labeled":
@@ -67,36 +71,28 @@ def get_label_metrics(issue: github3.issues.Issue, labels: List[str]) -> dict:
             if event.label["name"] in labels:
                 if label_metrics[event.label["name"]] is None:
                     label_metrics[event.label["name"]] = timedelta(0)
-                label_metrics[
-                    event.label["name"]
-                ] -= event.created_at - datetime.fromisoformat(issue.created_at)
+                label_metrics[event.label["name"]] -= event.created_at - created_at
                 label_last_event_type[event.label["name"]] = "labeled"
         elif event.event == "unlabeled":
             unlabeled[event.label["name"]] = True
             if event.label["name"] in labels:
                 if label_metrics[event.label["name"]] is None:
                     label_metrics[event.label["name"]] = timedelta(0)
-                label_metrics[
-                    event.label["name"]
-                ] += event.created_at - datetime.fromisoformat(issue.created_at)
+                label_metrics[event.label["name"]] += event.created_at - created_at
                 label_last_event_type[event.label["name"]] = "unlabeled"
 
     for label in labels:
         if label in labeled:
             # if the issue is closed, add the time from the issue creation to the closed_at time
             if issue.state == "closed":
-                label_metrics[label] += datetime.fromisoformat(
-                    issue.closed_at
-                ) - datetime.fromisoformat(issue.created_at)
+                label_metrics[label] += closed_at - created_at  # type: ignore
             else:
                 # skip label if last labeling event is 'unlabled' and issue is still open
                 if label_last_event_type[label] == "unlabeled":
                     continue
 
                 # if the issue is open, add the time from the issue creation to now
-                label_metrics[label] += datetime.now(pytz.utc) - datetime.fromisoformat(
-                    issue.created_at
-                )
+                label_metrics[label] += datetime.now(pytz.utc) - created_at
 
     return label_metrics
 
@@ -123,14 +119,15 @@ def get_stats_time_in_labels(
     med_time_in_labels: dict[str, timedelta | None] = {}
     ninety_percentile_in_labels: dict[str, timedelta | None] = {}
     for label, time_list in time_in_labels.items():
+        seconds_in_label = numpy.array(time_list)
         average_time_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.average(time_list))
+            seconds=numpy.round(numpy.average(seconds_in_label))
         )
         med_time_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.median(time_list))
+            seconds=numpy.round(numpy.median(seconds_in_label))
         )
         ninety_percentile_in_labels[label] = timedelta(
-            seconds=numpy.round(numpy.percentile(time_list, 90, axis=0))
+            seconds=numpy.round(numpy.percentile(seconds_in_label, 90, axis=0))
         )
 
     for label in labels:
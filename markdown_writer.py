@@ -32,6 +32,7 @@ Functions:
         Get the columns that are not hidden.
 """
 
+import io
 from datetime import timedelta
 from typing import List, Union
 
@@ -143,7 +144,8 @@ def write_to_markdown(
     """
     columns = get_non_hidden_columns(labels)
     output_file_name = output_file if output_file else "issue_metrics.md"
-    with open(output_file_name, "w", encoding="utf-8") as file:
+    # Build the whole report in memory and write it to the file at once
+    with io.StringIO() as file:
         file.write(f"# {report_title}\n\n")
 
         # If all the metrics are None, then there are no issues
@@ -155,6 +157,7 @@ def write_to_markdown(
             )
             if search_query:
                 file.write(f"Search query used to find these items: `{search_query}`\n")
+            write_report_to_file(file, output_file_name)
             return
 
         # Write first table with overall metrics
@@ -189,6 +192,13 @@ def write_to_markdown(
             file.write(" --- |")
         file.write("\n")
 
+        # Work out what is the same for every row before writing the rows
+        endpoint = ghe.removeprefix("https://") if ghe else "github.com"
+        shown_columns = set(columns)
+        shown_labels = [
+            label for label in labels or [] if f"Time spent in {label}" in shown_columns
+        ]
+
         # Then write the issues/pr/discussions row by row
         for issue in issues_with_metrics:
             # Replace the vertical bar with the HTML entity
@@ -196,7 +206,6 @@ def write_to_markdown(
             # Replace any whitespace
             issue.title = issue.title.strip()
 
-            endpoint = ghe.removeprefix("https://") if ghe else "github.com"
             if non_mentioning_links:
                 file.write(
                     f"| {issue.title} | "
@@ -207,7 +216,7 @@ def write_to_markdown(
                 )
             else:
                 file.write(f"| {issue.title} | {issue.html_url} |")
-            if "Assignee" in columns:
+            if "Assignee" in shown_columns:
                 if issue.assignees:
                     assignee_links = [
                         f"[{assignee}](https://{endpoint}/{assignee})"
@@ -216,21 +225,20 @@ def write_to_markdown(
                     file.write(f" {', '.join(assignee_links)} |")
                 else:
                     file.write(" None |")
-            if "Author" in columns:
+            if "Author" in shown_columns:
                 file.write(f" [{issue.author}](https://{endpoint}/{issue.author}) |")
-            if "Time to first response" in columns:
+            if "Time to first response" in shown_columns:
                 file.write(f" {issue.time_to_first_response} |")
-            if "Time to close" in columns:
+            if "Time to close" in shown_columns:
                 file.write(f" {issue.time_to_close} |")
-            if "Time to answer" in columns:
+            if "Time to answer" in shown_columns:
                 file.write(f" {issue.time_to_answer} |")
-            if "Time in draft" in columns:
+            if "Time in draft" in shown_columns:
                 file.write(f" {issue.time_in_draft} |")
-            if labels and issue.label_metrics:
-                for label in labels:
-                    if f"Time spent in {label}" in columns:
-                        file.write(f" {issue.label_metrics[label]} |")
-            if "Created At" in columns:
+            if shown_labels and issue.label_metrics:
+                for label in shown_labels:
+                    file.write(f" {issue.label_metrics[label]} |")
+            if "Created At" in shown_columns:
                 file.write(f" {issue.created_at} |")
             file.write("\n")
         file.write(
@@ -239,10 +247,17 @@ def write_to_markdown(
         )
         if search_query:
             file.write(f"Search query used to find these items: `{search_query}`\n")
+        write_report_to_file(file, output_file_name)
 
     print(f"Wrote issue metrics to {output_file_name}")
 
 
+def write_report_to_file(report: io.StringIO, output_file_name: str) -> None:
+    """Write the report built in memory to the markdown file with a single write."""
+    with open(output_file_name, "w", encoding="utf-8") as file:
+        file.write(report.getvalue())
+
+
 def write_overall_metrics_tables(
     issues_with_metrics,
     stats_time_to_first_response,
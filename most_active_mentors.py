@@ -72,24 +72,27 @@ def count_comments_per_user(
 
     # Get the first comments
     if issue:
-        comments = issue.issue.comments(
-            number=max_comments_to_eval, sort="created", direction="asc"
-        )  # type: ignore
-        for comment in comments:
-            if ignore_comment(
-                issue.issue.user,
-                comment.user,
-                ignore_users,
-                comment.created_at,
-                ready_for_review_at,
-            ):
-                continue
-            # increase the number of comments left by current user by 1
-            if comment.user.login in mentor_count:
-                if mentor_count[comment.user.login] < heavily_involved:
-                    mentor_count[comment.user.login] += 1
-            else:
-                mentor_count[comment.user.login] = 1
+        # The search result already carries the number of comments,
+        # so skip the round trip to the API when there are none
+        if issue.comments:
+            comments = issue.issue.comments(
+                number=max_comments_to_eval, sort="created", direction="asc"
+            )  # type: ignore
+            for comment in comments:
+                if ignore_comment(
+                    issue.issue.user,
+                    comment.user,
+                    ignore_users,
+                    comment.created_at,
+                    ready_for_review_at,
+                ):
+                    continue
+                # increase the number of comments left by current user by 1
+                if comment.user.login in mentor_count:
+                    if mentor_count[comment.user.login] < heavily_involved:
+                        mentor_count[comment.user.login] += 1
+                else:
+                    mentor_count[comment.user.login] = 1
 
         # Check if the issue is actually a pull request
         # so we may also get the first review comment time
@@ -168,10 +171,11 @@ def get_mentor_count(issues_with_metrics: List[IssueWithMetrics], cutoff: int) -
 
     """
 
+    # Add up the counts in place rather than building a new Counter per issue
     mentor_count: Counter[str] = Counter({})
     for issue_with_metrics in issues_with_metrics:
-        current_counter = Counter(issue_with_metrics.mentor_activity)
-        mentor_count = mentor_count + current_counter
+        if issue_with_metrics.mentor_activity:
+            mentor_count.update(issue_with_metrics.mentor_activity)
 
     active_mentor_count = 0
     for count in mentor_count.values():
@@ -0,0 +1,180 @@
+"""A module for caching GitHub API responses on disk between runs.
+
+GitHub answers conditional requests (If-None-Match) with a 304 Not Modified
+when nothing has changed, and those responses do not count against the rate
+limit. This module stores the ETag and body of each successful GET response
+and replays the stored body when GitHub reports it is still current.
+
+The responses are loaded into memory when the cache is opened and written
+back to the file once, by ETagCacheAdapter.prune() or close(). prune() also
+drops the entries that were not requested during the run, so that the file
+does not keep growing when it is carried over between scheduled runs.
+
+Classes:
+    ETagCacheAdapter: A requests transport adapter that makes conditional
+        requests using a persistent ETag cache.
+
+Functions:
+    enable_response_cache(
+        session: requests.Session,
+        cache_file: str,
+    ) -> ETagCacheAdapter:
+        Mount an ETagCacheAdapter on a session.
+"""
+
+import shelve
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class ETagCacheAdapter(HTTPAdapter):
+    """A transport adapter that caches GET responses by URL and ETag.
+
+    Attributes:
+        cache_file (str): The path of the file the responses are stored in.
+    """
+
+    def __init__(self, cache_file: str, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_file = cache_file
+        # Work on an in-memory copy: the dbm backends behind shelve cannot be
+        # shared between the threads that send the requests
+        with shelve.open(cache_file) as cache:
+            self._cache = dict(cache)
+        self._changed = False
+        # The URLs requested since the cache was opened, kept by prune()
+        self._used_keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream=False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        """Send the request, replaying the cached body on a 304 response."""
+        kwargs = {
+            "stream": stream,
+            "timeout": timeout,
+            "verify": verify,
+            "cert": cert,
+            "proxies": proxies,
+        }
+        # Leave requests that already manage their own conditions alone
+        if request.method != "GET" or "If-None-Match" in request.headers:
+            return super().send(request, **kwargs)
+
+        key = str(request.url)
+        with self._lock:
+            self._used_keys.add(key)
+            cached = self._cache.get(key)
+        if cached:
+            request.headers["If-None-Match"] = cached["etag"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and cached:
+            return self._build_cached_response(request, response, cached)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            with self._lock:
+                self._cache[key] = {
+                    "etag": etag,
+                    "headers": dict(response.headers),
+                    "content": response.content,
+                }
+                self._changed = True
+
+        return response
+
+    def prune(self) -> int:
+        """Remove the cached responses that were not requested in this run.
+
+        Nothing is removed if no responses were requested at all, so that a
+        run that did not use the cache leaves the file as it found it.
+
+        Returns:
+            int: The number of cached responses removed.
+        """
+        with self._lock:
+            if not self._used_keys:
+                return 0
+            unused_keys = [key for key in self._cache if key not in self._used_keys]
+            for key in unused_keys:
+                del self._cache[key]
+            self._changed = self._changed or bool(unused_keys)
+        self.save()
+        return len(unused_keys)
+
+    def save(self) -> None:
+        """Write the cached responses to the cache file, if they changed."""
+        with self._lock:
+            if not self._changed:
+                return
+            with shelve.open(self.cache_file, flag="n") as cache:
+                cache.update(self._cache)
+            self._changed = False
+
+    def close(self) -> None:
+        """Close the connection pools and save the cached responses."""
+        super().close()
+        self.save()
+
+    @staticmethod
+    def _build_cached_response(
+        request: requests.PreparedRequest,
+        not_modified: requests.Response,
+        cached: dict,
+    ) -> requests.Response:
+        """Build a 200 response from the cache and a 304 response."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = not_modified.url
+        response.request = request
+        response.elapsed = not_modified.elapsed
+        response.encoding = not_modified.encoding
+        # Keep the fresh headers (e.g. the rate limit) over the cached ones,
+        # except for those describing the (empty) body of the 304 response
+        response.headers = CaseInsensitiveDict(cached["headers"])
+        for header, value in not_modified.headers.items():
+            if not header.lower().startswith("content-"):
+                response.headers[header] = value
+        response._content = cached["content"]  # pylint: disable=protected-access
+        return response
+
+
+def enable_response_cache(
+    session: requests.Session, cache_file: str
+) -> ETagCacheAdapter:
+    """Mount an ETagCacheAdapter for all HTTPS requests made by a session.
+
+    The connection pool and retry settings of the adapter being replaced
+    are carried over to the new adapter.
+
+    Args:
+        session (requests.Session): The session used to talk to the GitHub API.
+        cache_file (str): The path of the file to store the responses in.
+
+    Returns:
+        ETagCacheAdapter: The adapter mounted on the session.
+    """
+    current_adapter = session.get_adapter("https://")
+    kwargs = {}
+    if isinstance(current_adapter, HTTPAdapter):
+        # pylint: disable=protected-access
+        kwargs = {
+            "pool_connections": current_adapter._pool_connections,
+            "pool_maxsize": current_adapter._pool_maxsize,
+            "max_retries": current_adapter.max_retries,
+        }
+    adapter = ETagCacheAdapter(cache_file, **kwargs)
+    session.mount("https://", adapter)
+    return adapter
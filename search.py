@@ -42,7 +42,18 @@ def search_issues(
         retry_count = 0
         sleep_time = 70
 
-        while iterator.ratelimit_remaining < 5:
+        # Every page of search results reports the remaining rate limit in its
+        # headers, so only ask the rate_limit endpoint when there is no page yet
+        # or after waiting for the rate limit to refresh
+        last_response = iterator.last_response
+        if last_response is not None and "X-RateLimit-Remaining" in (
+            last_response.headers
+        ):
+            ratelimit_remaining = int(last_response.headers["X-RateLimit-Remaining"])
+        else:
+            ratelimit_remaining = iterator.ratelimit_remaining
+
+        while ratelimit_remaining < 5:
             if retry_count >= max_retries:
                 raise RuntimeError("Exceeded maximum retries for API rate limit")
 
@@ -54,6 +65,7 @@ def search_issues(
             # Exponentially increase the sleep time for the next retry
             sleep_time *= 2
             retry_count += 1
+            ratelimit_remaining = iterator.ratelimit_remaining
 
     issues_per_page = 100
 
@@ -70,10 +82,9 @@ def search_issues(
             f"{item.get('owner', '')}/{item.get('repository', '')} "
         )
 
-    # Print the issue titles and add them to the list of issues
+    # Add the issues to the list of issues
     try:
         for idx, issue in enumerate(issues_iterator, 1):
-            print(issue.title)  # type: ignore
             issues.append(issue)
 
             # requests are sent once per page of issues
@@ -109,6 +120,7 @@ Check the repository owner and names: '{repos_and_owners_string}"
         print_error_messages(e)
         sys.exit(1)
 
+    print(f"Found {len(issues)} items")
     return issues
 
 
@@ -141,14 +153,11 @@ def get_owners_and_repositories(
     for item in search_query_split:
         result = {}
         if "repo:" in item and "/" in item:
-            result["owner"] = item.split(":")[1].split("/")[0]
-            result["repository"] = item.split(":")[1].split("/")[1]
+            owner_and_repository = item.split(":")[1].split("/")
+            result["owner"] = owner_and_repository[0]
+            result["repository"] = owner_and_repository[1]
         if "org:" in item or "owner:" in item or "user:" in item:
             result["owner"] = item.split(":")[1]
-        if "user:" in item:
-            result["owner"] = item.split(":")[1]
-        if "owner:" in item:
-            result["owner"] = item.split(":")[1]
         if result:
             results_list.append(result)
 
@@ -38,6 +38,15 @@ class TestAuthToGithub(unittest.TestCase):
 
         self.assertIsInstance(result, github3.github.GitHub, False)
 
+    def test_auth_to_github_retries_rate_limited_requests(self):
+        """
+        Test the auth_to_github function sets up retries for rate limited requests.
+        """
+        result = auth_to_github("token", None, None, b"", "", False)
+
+        adapter = result.session.get_adapter("https://api.github.com")
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
     def test_auth_to_github_without_authentication_information(self):
         """
         Test the auth_to_github function when authentication information is not provided.
@@ -85,6 +85,7 @@ class TestGetEnvVars(unittest.TestCase):
             "REPORT_TITLE",
             "SEARCH_QUERY",
             "RATE_LIMIT_BYPASS",
+            "RESPONSE_CACHE_FILE",
         ]
         for key in env_keys:
             if key in os.environ:
@@ -257,6 +258,7 @@ class TestGetEnvVars(unittest.TestCase):
             "SEARCH_QUERY": SEARCH_QUERY,
             "RATE_LIMIT_BYPASS": "true",
             "DRAFT_PR_TRACKING": "True",
+            "RESPONSE_CACHE_FILE": ".gh_cache",
         },
     )
     def test_get_env_vars_optional_values(self):
@@ -288,6 +290,7 @@ class TestGetEnvVars(unittest.TestCase):
             output_file="issue_metrics.md",
             rate_limit_bypass=True,
             draft_pr_tracking=True,
+            response_cache_file=".gh_cache",
         )
         result = get_env_vars(True)
         self.assertEqual(str(result), str(expected_result))
@@ -21,13 +21,13 @@ class TestGetDiscussions(unittest.TestCase):
         return {
             "data": {
                 "search": {
-                    "edges": [{"node": discussion} for discussion in discussions],
+                    "nodes": discussions,
                     "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
                 }
             }
         }
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_discussions_single_page(self, mock_post):
         """Test the get_discussions function with a single page of results."""
         # Mock data for two discussions
@@ -67,7 +67,7 @@ class TestGetDiscussions(unittest.TestCase):
         # Verify only one API call was made
         self.assertEqual(mock_post.call_count, 1)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_discussions_multiple_pages(self, mock_post):
         """Test the get_discussions function with multiple pages of results."""
         # Mock data for pagination
@@ -114,7 +114,7 @@ class TestGetDiscussions(unittest.TestCase):
         # Verify that two API calls were made
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_discussions_error_status_code(self, mock_post):
         """Test the get_discussions function with a failed HTTP response."""
         mock_post.return_value.status_code = 500
@@ -126,7 +126,7 @@ class TestGetDiscussions(unittest.TestCase):
             "GraphQL query failed with status code 500", str(context.exception)
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_discussions_graphql_error(self, mock_post):
         """Test the get_discussions function with GraphQL errors in response."""
         mock_post.return_value.status_code = 200
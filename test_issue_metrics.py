@@ -12,6 +12,7 @@ Classes:
 """
 
 import os
+import time
 import unittest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, call, patch
@@ -365,6 +366,47 @@ class TestGetPerIssueMetrics(unittest.TestCase):
             expected_issues_with_metrics[0].time_to_close,
         )
 
+    @patch.dict(
+        os.environ,
+        {
+            "GH_TOKEN": "test_token",
+            "SEARCH_QUERY": "is:pr is:open repo:user/repo",
+            "HIDE_TIME_TO_CLOSE": "true",
+            "HIDE_TIME_TO_FIRST_RESPONSE": "true",
+        },
+    )
+    def test_get_per_issue_metrics_skips_unneeded_pull_request_fetch(self):
+        """
+        Test that the pull request is not fetched when no metric needs it
+        """
+
+        # Create mock data
+        mock_pull_request = MagicMock(
+            title="PR 1",
+            html_url="https://github.com/user/repo/pull/1",
+            user={"login": "alice"},
+            state="closed",
+            comments=0,
+            created_at="2023-01-01T00:00:00Z",
+            closed_at="2023-01-04T00:00:00Z",
+        )
+        mock_pull_request.issue.pull_request_urls = {"url": "pull/1"}
+
+        # Call the function and check the result
+        (
+            result_issues_with_metrics,
+            result_num_issues_open,
+            result_num_issues_closed,
+        ) = get_per_issue_metrics(
+            [mock_pull_request],
+            env_vars=get_env_vars(test=True),
+        )
+
+        mock_pull_request.issue.pull_request.assert_not_called()
+        self.assertEqual(len(result_issues_with_metrics), 1)
+        self.assertEqual(result_num_issues_open, 0)
+        self.assertEqual(result_num_issues_closed, 1)
+
 
 class TestDiscussionMetrics(unittest.TestCase):
     """Test suite for the discussion_metrics function."""
@@ -475,6 +517,34 @@ class TestDiscussionMetrics(unittest.TestCase):
         self.assertEqual(metrics[0][1].time_to_close, None)
         self.assertEqual(metrics[0][1].time_to_first_response, None)
 
+    @patch.dict(
+        os.environ,
+        {"GH_TOKEN": "test_token", "SEARCH_QUERY": "is:issue is:open repo:user/repo"},
+    )
+    def test_get_per_issue_metrics_with_discussion_keeps_order(self):
+        """
+        Test that the metrics are returned in the same order as the discussions
+        even when the metrics for a later discussion are fetched first.
+        """
+
+        def slow_first_response(_issue, discussion, _ignore_users):
+            if discussion is self.issue1:
+                time.sleep(0.05)
+
+        issues = [self.issue1, self.issue2]
+        with patch("issue_metrics.measure_time_to_first_response", slow_first_response):
+            metrics = get_per_issue_metrics(
+                issues,
+                discussions=True,
+                env_vars=get_env_vars(test=True),
+                max_workers=2,
+            )
+
+        self.assertEqual(
+            [issue.html_url for issue in metrics[0]],
+            [self.issue1["url"], self.issue2["url"]],
+        )
+
 
 class TestEvaluateMarkdownFileSize(unittest.TestCase):
     """Test suite for the evaluate_markdown_file_size function."""
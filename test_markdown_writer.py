@@ -10,7 +10,7 @@ Classes:
 import os
 import unittest
 from datetime import timedelta
-from unittest.mock import call, mock_open, patch
+from unittest.mock import mock_open, patch
 
 from classes import IssueWithMetrics
 from markdown_writer import write_to_markdown
@@ -286,14 +286,8 @@ class TestWriteToMarkdown(unittest.TestCase):
             "no issues found for the given search criteria\n\n",
             "\n_This report was generated with the [Issue Metrics Action](https://github.com/github/issue-metrics)_\n",
         ]
-        # Check that the markdown file was written with the three calls in expected output
-        mock_open_file.assert_has_calls(
-            [
-                call().write(expected_output[0]),
-                call().write(expected_output[1]),
-                call().write(expected_output[2]),
-            ]
-        )
+        # Check that the markdown file was written with a single call
+        mock_open_file().write.assert_called_once_with("".join(expected_output))
 
 
 @patch.dict(
@@ -93,6 +93,23 @@ class TestCountCommentsPerUser(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.assertNotIn("very_active_user_ignored", result)
 
+    def test_count_comments_per_user_no_comments(self):
+        """Test that count_comments_per_user skips fetching comments when there are none."""
+        # Set up the mock GitHub issue with no comments
+        mock_issue1 = MagicMock()
+        mock_issue1.comments = 0
+        mock_issue1.issue.user.login = "issue_owner"
+        mock_issue_comments = MagicMock()
+        mock_issue1.issue.comments = mock_issue_comments
+        mock_issue1.created_at = "2023-01-01T00:00:00Z"
+
+        # Call the function
+        result = count_comments_per_user(mock_issue1)
+
+        # Check the results
+        self.assertEqual(result, {})
+        mock_issue_comments.assert_not_called()
+
     def test_get_mentor_count(self):
         """Test that get_mentor_count correctly counts comments per user."""
         mentor_activity = {"sue": 15, "bob": 10}
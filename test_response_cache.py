@@ -0,0 +1,182 @@
+"""A module containing unit tests for the response_cache module.
+
+Classes:
+    TestETagCacheAdapter: A class to test the ETagCacheAdapter class.
+    TestEnableResponseCache: A class to test the enable_response_cache function.
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+from response_cache import ETagCacheAdapter, enable_response_cache
+
+URL = "https://api.github.com/repos/owner/repo/issues/1/comments"
+
+
+def make_response(status_code, headers=None, content=b""):
+    """Build a requests.Response with the given status, headers and body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = content  # pylint: disable=protected-access
+    response.url = URL
+    return response
+
+
+class TestETagCacheAdapter(unittest.TestCase):
+    """Test the ETagCacheAdapter class."""
+
+    def setUp(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.adapter = ETagCacheAdapter(os.path.join(temp_dir, "cache"))
+        self.addCleanup(self.adapter.close)
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_send_replays_cached_body_on_not_modified(self, mock_send):
+        """Test that a 304 response is answered with the cached body."""
+        mock_send.side_effect = [
+            make_response(200, {"ETag": '"abc"'}, b'[{"id": 1}]'),
+            make_response(304, {"ETag": '"abc"', "X-RateLimit-Remaining": "42"}),
+        ]
+
+        first = self.adapter.send(requests.Request("GET", URL).prepare())
+        request = requests.Request("GET", URL).prepare()
+        second = self.adapter.send(request)
+
+        self.assertEqual(first.json(), [{"id": 1}])
+        self.assertEqual(request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), [{"id": 1}])
+        self.assertEqual(second.headers["X-RateLimit-Remaining"], "42")
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_send_updates_cache_on_changed_response(self, mock_send):
+        """Test that a changed response replaces the cached one."""
+        mock_send.side_effect = [
+            make_response(200, {"ETag": '"abc"'}, b"[1]"),
+            make_response(200, {"ETag": '"def"'}, b"[2]"),
+            make_response(304),
+        ]
+
+        for _ in range(2):
+            self.adapter.send(requests.Request("GET", URL).prepare())
+        request = requests.Request("GET", URL).prepare()
+        response = self.adapter.send(request)
+
+        self.assertEqual(request.headers["If-None-Match"], '"def"')
+        self.assertEqual(response.json(), [2])
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_send_skips_cache_for_non_get_requests(self, mock_send):
+        """Test that only GET requests are cached."""
+        mock_send.return_value = make_response(200, {"ETag": '"abc"'}, b"{}")
+
+        for _ in range(2):
+            request = requests.Request("POST", URL, json={}).prepare()
+            self.adapter.send(request)
+
+        self.assertNotIn("If-None-Match", request.headers)
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_prune_removes_entries_not_requested(self, mock_send):
+        """Test that prune drops the responses not requested since opening."""
+        other_url = "https://api.github.com/repos/owner/repo/issues/2/comments"
+        mock_send.side_effect = lambda request, **kwargs: make_response(
+            200, {"ETag": '"abc"'}, b"[]"
+        )
+        for url in (URL, other_url):
+            self.adapter.send(requests.Request("GET", url).prepare())
+        cache_file = self.adapter.cache_file
+        self.adapter.close()
+
+        # A later run that only requests the first URL
+        adapter = ETagCacheAdapter(cache_file)
+        self.addCleanup(adapter.close)
+        request = requests.Request("GET", URL).prepare()
+        adapter.send(request)
+
+        self.assertEqual(request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(adapter.prune(), 1)
+        request = requests.Request("GET", other_url).prepare()
+        adapter.send(request)
+        self.assertNotIn("If-None-Match", request.headers)
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_send_from_worker_threads(self, mock_send):
+        """Test that responses cached from worker threads are saved on close."""
+        urls = [f"{URL}?page={page}" for page in range(10)]
+        mock_send.side_effect = lambda request, **kwargs: make_response(
+            200, {"ETag": '"abc"'}, b"[]"
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda url: self.adapter.send(
+                        requests.Request("GET", url).prepare()
+                    ),
+                    urls,
+                )
+            )
+        self.adapter.close()
+
+        adapter = ETagCacheAdapter(self.adapter.cache_file)
+        self.addCleanup(adapter.close)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            requests_sent = list(
+                executor.map(lambda url: requests.Request("GET", url).prepare(), urls)
+            )
+            list(executor.map(adapter.send, requests_sent))
+
+        for request in requests_sent:
+            self.assertEqual(request.headers["If-None-Match"], '"abc"')
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_prune_keeps_entries_when_nothing_was_requested(self, mock_send):
+        """Test that prune leaves the cache alone when the run made no requests."""
+        mock_send.return_value = make_response(200, {"ETag": '"abc"'}, b"[]")
+        self.adapter.send(requests.Request("GET", URL).prepare())
+        self.adapter.close()
+
+        adapter = ETagCacheAdapter(self.adapter.cache_file)
+        self.addCleanup(adapter.close)
+        self.assertEqual(adapter.prune(), 0)
+        adapter.close()
+
+        adapter = ETagCacheAdapter(self.adapter.cache_file)
+        self.addCleanup(adapter.close)
+        request = requests.Request("GET", URL).prepare()
+        adapter.send(request)
+        self.assertEqual(request.headers["If-None-Match"], '"abc"')
+
+
+class TestEnableResponseCache(unittest.TestCase):
+    """Test the enable_response_cache function."""
+
+    def test_enable_response_cache_keeps_adapter_settings(self):
+        """Test that the pool and retry settings of the old adapter are kept."""
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=20, max_retries=3))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            adapter = enable_response_cache(session, os.path.join(temp_dir, "cache"))
+            try:
+                self.assertIs(session.get_adapter(URL), adapter)
+                self.assertEqual(
+                    adapter._pool_maxsize, 20  # pylint: disable=protected-access
+                )
+                self.assertEqual(adapter.max_retries.total, 3)
+            finally:
+                adapter.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
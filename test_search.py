@@ -1,7 +1,7 @@
 """Unit tests for the search module."""
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from search import get_owners_and_repositories, search_issues
 
@@ -97,6 +97,33 @@ class TestSearchIssues(unittest.TestCase):
         )
         self.assertEqual(issues, mock_issues)
 
+    @patch("search.sleep")
+    def test_search_issues_waits_when_page_headers_report_low_rate_limit(
+        self, mock_sleep
+    ):
+        """Test that search_issues uses the rate limit reported by the last page."""
+
+        # Set up the mock GitHub connection object
+        mock_issues = [
+            MagicMock(title="Issue 1"),
+            MagicMock(title="Issue 2"),
+        ]
+
+        # simulating github3.structs.SearchIterator return value
+        mock_search_result = MagicMock()
+        mock_search_result.__iter__.return_value = iter(mock_issues)
+        mock_search_result.last_response.headers = {"X-RateLimit-Remaining": "2"}
+        mock_search_result.ratelimit_remaining = 30
+
+        mock_connection = MagicMock()
+        mock_connection.search_issues.return_value = mock_search_result
+
+        # Call search_issues and check that it waited once before continuing
+        owners = [{"owner": "org1"}]
+        issues = search_issues("is:open", mock_connection, owners)
+        self.assertEqual(issues, mock_issues)
+        mock_sleep.assert_called_once_with(70)
+
 
 class TestGetOwnerAndRepository(unittest.TestCase):
     """Unit tests for the get_owners_and_repositories function.
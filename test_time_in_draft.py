@@ -153,6 +153,22 @@ class TestGetStatsTimeInDraft(unittest.TestCase):
             result, expected, "The statistics for time in draft are incorrect."
         )
 
+    def test_get_stats_time_in_draft_zero_duration(self):
+        """
+        Test get_stats_time_in_draft counts a zero time in draft.
+        """
+        issues = [
+            MagicMock(time_in_draft=timedelta(0)),
+            MagicMock(time_in_draft=timedelta(days=2)),
+        ]
+
+        result = get_stats_time_in_draft(issues)
+        self.assertEqual(
+            result["avg"],
+            timedelta(days=1),
+            "A zero time in draft should count towards the statistics.",
+        )
+
     def test_get_stats_time_in_draft_no_data(self):
         """
         Test get_stats_time_in_draft with no draft times.
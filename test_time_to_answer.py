@@ -10,10 +10,11 @@ from time_to_answer import get_stats_time_to_answer, measure_time_to_answer
 class TestGetAverageTimeToAnswer(unittest.TestCase):
     """A test case for the get_stats_time_to_answer function.
 
-    This test case includes three test methods:
+    This test case includes four test methods:
     - test_returns_none_for_empty_list
     - test_returns_none_for_list_with_no_time_to_answer
     - test_returns_stats_time_to_answer
+    - test_returns_stats_time_to_answer_with_zero_duration
     """
 
     def test_returns_none_for_empty_list(self):
@@ -69,6 +70,26 @@ class TestGetAverageTimeToAnswer(unittest.TestCase):
         # Assert
         self.assertEqual(result, timedelta(seconds=20))
 
+    def test_returns_stats_time_to_answer_with_zero_duration(self):
+        """
+        Tests that a discussion answered right away counts towards
+        the stats instead of being skipped.
+        """
+
+        # Arrange
+        issues_with_metrics = [
+            IssueWithMetrics("issue1", "url1", "alice", None, None, timedelta(0)),
+            IssueWithMetrics(
+                "issue2", "url2", "bob", None, None, timedelta(seconds=20)
+            ),
+        ]
+
+        # Act
+        result = get_stats_time_to_answer(issues_with_metrics)["avg"]
+
+        # Assert
+        self.assertEqual(result, timedelta(seconds=10))
+
 
 class TestMeasureTimeToAnswer(unittest.TestCase):
     """A test case for the measure_time_to_answer function.
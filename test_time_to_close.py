@@ -69,6 +69,31 @@ class TestGetAverageTimeToClose(unittest.TestCase):
         expected_result = None
         self.assertEqual(result, expected_result)
 
+    def test_get_stats_time_to_close_zero_duration(self):
+        """Test that an issue closed right away counts towards the stats."""
+        # Create mock data
+        issues_with_metrics = [
+            IssueWithMetrics(
+                "Issue 1",
+                "https://github.com/user/repo/issues/1",
+                "alice",
+                None,
+                timedelta(0),
+            ),
+            IssueWithMetrics(
+                "Issue 2",
+                "https://github.com/user/repo/issues/2",
+                "bob",
+                None,
+                timedelta(days=2),
+            ),
+        ]
+
+        # Call the function and check the result
+        result = get_stats_time_to_close(issues_with_metrics)["avg"]
+        expected_result = timedelta(days=1)
+        self.assertEqual(result, expected_result)
+
 
 class TestMeasureTimeToClose(unittest.TestCase):
     """Test suite for the measure_time_to_close function."""
@@ -58,6 +58,8 @@ class TestMeasureTimeToFirstResponse(unittest.TestCase):
         mock_issue1 = MagicMock()
         mock_issue1.comments = 0
         mock_issue1.issue.user.login = "issue_owner"
+        mock_issue_comments = MagicMock()
+        mock_issue1.issue.comments = mock_issue_comments
         mock_issue1.created_at = "2023-01-01T00:00:00Z"
 
         # Call the function
@@ -66,6 +68,7 @@ class TestMeasureTimeToFirstResponse(unittest.TestCase):
 
         # Check the results
         self.assertEqual(result, expected_result)
+        mock_issue_comments.assert_not_called()
 
     def test_measure_time_to_first_response_with_pull_request_comments(self):
         """Test that measure_time_to_first_response with pull request comments."""
@@ -409,6 +412,29 @@ class TestGetStatsTimeToFirstResponse(unittest.TestCase):
         expected_result = timedelta(days=1.5)
         self.assertEqual(result, expected_result)
 
+    def test_get_stats_time_to_first_response_zero_duration(self):
+        """Test that an issue responded to right away counts towards the stats."""
+        # Create mock data
+        issues_with_metrics = [
+            IssueWithMetrics(
+                "Issue 1",
+                "https://github.com/user/repo/issues/1",
+                "alice",
+                timedelta(0),
+            ),
+            IssueWithMetrics(
+                "Issue 2",
+                "https://github.com/user/repo/issues/2",
+                "bob",
+                timedelta(days=2),
+            ),
+        ]
+
+        # Call the function and check the result
+        result = get_stats_time_to_first_response(issues_with_metrics)["avg"]
+        expected_result = timedelta(days=1)
+        self.assertEqual(result, expected_result)
+
     def test_get_stats_time_to_first_response_with_all_none(self):
         """Test that get_stats_time_to_first_response with all None data."""
 
@@ -47,28 +47,23 @@ def get_stats_time_in_draft(
     """
     Calculate stats describing the time in draft for a list of issues.
     """
-    # Filter out issues with no time in draft
-    issues_with_time_to_draft = [
-        issue for issue in issues_with_metrics if issue.time_in_draft is not None
-    ]
-
-    # Calculate the total time in draft for all issues
-    draft_times = []
-    if issues_with_time_to_draft:
-        for issue in issues_with_time_to_draft:
-            if issue.time_in_draft:
-                draft_times.append(issue.time_in_draft.total_seconds())
+    # Collect the time in draft in seconds of the issues that have one
+    draft_seconds = numpy.array(
+        [
+            issue.time_in_draft.total_seconds()
+            for issue in issues_with_metrics
+            if issue.time_in_draft is not None
+        ]
+    )
+    if not draft_seconds.size:
+        return None
 
     # Calculate stats describing time in draft
-    num_issues_with_time_in_draft = len(issues_with_time_to_draft)
-    if num_issues_with_time_in_draft > 0:
-        average_time_in_draft = numpy.round(numpy.average(draft_times))
-        med_time_in_draft = numpy.round(numpy.median(draft_times))
-        ninety_percentile_time_in_draft = numpy.round(
-            numpy.percentile(draft_times, 90, axis=0)
-        )
-    else:
-        return None
+    average_time_in_draft = numpy.round(numpy.average(draft_seconds))
+    med_time_in_draft = numpy.round(numpy.median(draft_seconds))
+    ninety_percentile_time_in_draft = numpy.round(
+        numpy.percentile(draft_seconds, 90, axis=0)
+    )
 
     stats = {
         "avg": timedelta(seconds=average_time_in_draft),
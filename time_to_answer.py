@@ -28,28 +28,23 @@ def get_stats_time_to_answer(
     """
     Calculate stats describing the time to answer for a list of issues.
     """
-    # Filter out issues with no time to answer
-    issues_with_time_to_answer = [
-        issue for issue in issues_with_metrics if issue.time_to_answer is not None
-    ]
-
-    # Calculate the total time to answer for all issues
-    answer_times = []
-    if issues_with_time_to_answer:
-        for issue in issues_with_time_to_answer:
-            if issue.time_to_answer:
-                answer_times.append(issue.time_to_answer.total_seconds())
+    # Collect the time to answer in seconds of the issues that have one
+    answer_seconds = numpy.array(
+        [
+            issue.time_to_answer.total_seconds()
+            for issue in issues_with_metrics
+            if issue.time_to_answer is not None
+        ]
+    )
+    if not answer_seconds.size:
+        return None
 
     # Calculate stats describing time to answer
-    num_issues_with_time_to_answer = len(issues_with_time_to_answer)
-    if num_issues_with_time_to_answer > 0:
-        average_time_to_answer = numpy.round(numpy.average(answer_times))
-        med_time_to_answer = numpy.round(numpy.median(answer_times))
-        ninety_percentile_time_to_answer = numpy.round(
-            numpy.percentile(answer_times, 90, axis=0)
-        )
-    else:
-        return None
+    average_time_to_answer = numpy.round(numpy.average(answer_seconds))
+    med_time_to_answer = numpy.round(numpy.median(answer_seconds))
+    ninety_percentile_time_to_answer = numpy.round(
+        numpy.percentile(answer_seconds, 90, axis=0)
+    )
 
     stats = {
         "avg": timedelta(seconds=average_time_to_answer),
@@ -68,30 +68,23 @@ def get_stats_time_to_close(
         Union[Dict{string: float}, None]: Stats describing the time to close for the issues.
 
     """
-    # Filter out issues with no time to close
-    issues_with_time_to_close = [
-        issue for issue in issues_with_metrics if issue.time_to_close is not None
-    ]
-
-    # Calculate the total time to close for all issues
-    close_times = []
-    total_time_to_close = None
-    if issues_with_time_to_close:
-        total_time_to_close = 0
-        for issue in issues_with_time_to_close:
-            if issue.time_to_close:
-                close_times.append(issue.time_to_close.total_seconds())
+    # Collect the time to close in seconds of the issues that have one
+    close_seconds = numpy.array(
+        [
+            issue.time_to_close.total_seconds()
+            for issue in issues_with_metrics
+            if issue.time_to_close is not None
+        ]
+    )
+    if not close_seconds.size:
+        return None
 
     # Calculate stats describing time to close
-    num_issues_with_time_to_close = len(issues_with_time_to_close)
-    if num_issues_with_time_to_close > 0 and total_time_to_close is not None:
-        average_time_to_close = numpy.round(numpy.average(close_times))
-        med_time_to_close = numpy.round(numpy.median(close_times))
-        ninety_percentile_time_to_close = numpy.round(
-            numpy.percentile(close_times, 90, axis=0)
-        )
-    else:
-        return None
+    average_time_to_close = numpy.round(numpy.average(close_seconds))
+    med_time_to_close = numpy.round(numpy.median(close_seconds))
+    ninety_percentile_time_to_close = numpy.round(
+        numpy.percentile(close_seconds, 90, axis=0)
+    )
 
     stats = {
         "avg": timedelta(seconds=average_time_to_close),
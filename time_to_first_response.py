@@ -54,20 +54,23 @@ def measure_time_to_first_response(
 
     # Get the first comment time
     if issue:
-        comments = issue.issue.comments(
-            number=20, sort="created", direction="asc"
-        )  # type: ignore
-        for comment in comments:
-            if ignore_comment(
-                issue.issue.user,
-                comment.user,
-                ignore_users,
-                comment.created_at,
-                ready_for_review_at,
-            ):
-                continue
-            first_comment_time = comment.created_at
-            break
+        # The search result already carries the number of comments,
+        # so skip the round trip to the API when there are none
+        if issue.comments:
+            comments = issue.issue.comments(
+                number=20, sort="created", direction="asc"
+            )  # type: ignore
+            for comment in comments:
+                if ignore_comment(
+                    issue.issue.user,
+                    comment.user,
+                    ignore_users,
+                    comment.created_at,
+                    ready_for_review_at,
+                ):
+                    continue
+                first_comment_time = comment.created_at
+                break
 
         # Check if the issue is actually a pull request
         # so we may also get the first review comment time
@@ -161,21 +164,22 @@ def get_stats_time_to_first_response(
         Union[Dict{String: datetime.timedelta}, None]: The stats describing time to first response for the issues in seconds.
 
     """
-    response_times = []
-    none_count = 0
-    for issue in issues:
-        if issue.time_to_first_response:
-            response_times.append(issue.time_to_first_response.total_seconds())
-        else:
-            none_count += 1
-
-    if len(issues) - none_count <= 0:
+    # Collect the time to first response in seconds of the issues that have one,
+    # including responses that came in the same second the issue was opened
+    response_seconds = numpy.array(
+        [
+            issue.time_to_first_response.total_seconds()
+            for issue in issues
+            if issue.time_to_first_response is not None
+        ]
+    )
+    if not response_seconds.size:
         return None
 
-    average_seconds_to_first_response = numpy.round(numpy.average(response_times))
-    med_seconds_to_first_response = numpy.round(numpy.median(response_times))
+    average_seconds_to_first_response = numpy.round(numpy.average(response_seconds))
+    med_seconds_to_first_response = numpy.round(numpy.median(response_seconds))
     ninety_percentile_seconds_to_first_response = numpy.round(
-        numpy.percentile(response_times, 90, axis=0)
+        numpy.percentile(response_seconds, 90, axis=0)
     )
 
     stats = {